@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Basketball Team": {
         "description": "Competitive basketball league and practice",
         "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
+        "participants": dict.fromkeys(["alex@mergington.edu"])
     },
     "Tennis Club": {
         "description": "Tennis lessons and friendly matches",
         "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
         "max_participants": 16,
-        "participants": ["ryan@mergington.edu", "jessica@mergington.edu"]
+        "participants": dict.fromkeys(["ryan@mergington.edu", "jessica@mergington.edu"])
     },
     "Drama Club": {
         "description": "Theater productions and acting workshops",
         "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["lisa@mergington.edu"]
+        "participants": dict.fromkeys(["lisa@mergington.edu"])
     },
     "Art Studio": {
         "description": "Painting, drawing, and mixed media art",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["maya@mergington.edu", "chris@mergington.edu"]
+        "participants": dict.fromkeys(["maya@mergington.edu", "chris@mergington.edu"])
     },
     "Debate Team": {
         "description": "Competitive debate and public speaking",
         "schedule": "Mondays and Wednesdays, 3:30 PM - 4:45 PM",
         "max_participants": 20,
-        "participants": ["marcus@mergington.edu"]
+        "participants": dict.fromkeys(["marcus@mergington.edu"])
     },
     "Science Club": {
         "description": "Hands-on experiments and STEM exploration",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 22,
-        "participants": ["anna@mergington.edu", "thomas@mergington.edu"]
+        "participants": dict.fromkeys(["anna@mergington.edu", "thomas@mergington.edu"])
     }
 }
 
@@ -85,7 +85,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as insertion-ordered dict keys; serialize them as JSON lists
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +107,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -122,5 +126,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
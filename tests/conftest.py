@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+# Add src directory to path so we can import app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app import app, activities
+
+# Participants as loaded at import time; read-only proxies keep the baseline immutable
+_PRISTINE_PARTICIPANTS = {
+    k: MappingProxyType(dict.fromkeys(v["participants"])) for k, v in activities.items()
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app, shared across the session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(client):
+    """Issue one request up front so portal and routing setup isn't billed to the first test"""
+    client.get("/activities")
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state before each test"""
+    yield
+    # Restore original state in place
+    for activity_name, participants in _PRISTINE_PARTICIPANTS.items():
+        activities[activity_name]["participants"].clear()
+        activities[activity_name]["participants"].update(participants)
+
+
+@pytest.fixture(scope="session")
+def activities_response(client):
+    """Fetch the activities list once per session; use only for structure/field checks, never participant state"""
+    return client.get("/activities").json()
+
+
+@pytest.fixture
+def participants_of():
+    """Snapshot an activity's participants in-process, without an HTTP round-trip"""
+    def _participants_of(activity_name):
+        return frozenset(activities[activity_name]["participants"])
+    return _participants_of
@@ -3,33 +3,19 @@ Tests for the Mergington High School Activities API
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities
 
-from app import app
+ACTIVITY_NAMES = list(activities.keys())
 
+# Single place to define the signup/unregister routes used throughout the tests
+SIGNUP_URL = "/activities/{}/signup".format
+UNREGISTER_URL = "/activities/{}/unregister".format
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    from app import activities
-    original_state = {k: {"participants": v["participants"].copy(), **{k2: v2 for k2, v2 in v.items() if k2 != "participants"}} 
-                     for k, v in activities.items()}
-    yield
-    # Restore original state
-    for activity_name, data in original_state.items():
-        activities[activity_name]["participants"] = data["participants"]
+def _seed(activity_name, email):
+    """Add a participant directly, for tests that only need signup as setup"""
+    activities[activity_name]["participants"][email] = None
 
 
 class TestGetActivities:
@@ -47,16 +33,15 @@ class TestGetActivities:
         assert data["Chess Club"]["max_participants"] == 12
         assert "participants" in data["Chess Club"]
     
-    def test_get_activities_contains_all_required_fields(self, client, reset_activities):
-        """Test that activities contain all required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-            assert isinstance(activity_data["participants"], list)
+    @pytest.mark.parametrize("activity_name", ACTIVITY_NAMES)
+    def test_get_activities_contains_all_required_fields(self, activities_response, activity_name):
+        """Test that each activity contains all required fields"""
+        activity_data = activities_response[activity_name]
+        assert "description" in activity_data
+        assert "schedule" in activity_data
+        assert "max_participants" in activity_data
+        assert "participants" in activity_data
+        assert isinstance(activity_data["participants"], list)
 
 
 class TestSignupForActivity:
@@ -65,7 +50,7 @@ class TestSignupForActivity:
     def test_signup_success(self, client, reset_activities):
         """Test successfully signing up for an activity"""
         response = client.post(
-            "/activities/Chess Club/signup",
+            SIGNUP_URL("Chess Club"),
             params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 200
@@ -74,22 +59,29 @@ class TestSignupForActivity:
         assert "test@mergington.edu" in data["message"]
         assert "Chess Club" in data["message"]
     
-    def test_signup_adds_participant(self, client, reset_activities):
+    def test_signup_adds_participant(self, client, reset_activities, participants_of):
         """Test that signup actually adds the participant"""
         # First signup
         client.post(
-            "/activities/Chess Club/signup",
+            SIGNUP_URL("Chess Club"),
             params={"email": "newtestuser@mergington.edu"}
         )
         # Verify participant was added
-        response = client.get("/activities")
-        activities = response.json()
-        assert "newtestuser@mergington.edu" in activities["Chess Club"]["participants"]
+        assert "newtestuser@mergington.edu" in participants_of("Chess Club")
+    
+    def test_signup_appends_participant_in_order(self, client, reset_activities):
+        """Test that a new signup is listed after existing participants"""
+        client.post(
+            SIGNUP_URL("Chess Club"),
+            params={"email": "ordered@mergington.edu"}
+        )
+        participants = client.get("/activities").json()["Chess Club"]["participants"]
+        assert participants == ["michael@mergington.edu", "daniel@mergington.edu", "ordered@mergington.edu"]
     
     def test_signup_nonexistent_activity(self, client, reset_activities):
         """Test signing up for an activity that doesn't exist"""
         response = client.post(
-            "/activities/Nonexistent Activity/signup",
+            SIGNUP_URL("Nonexistent Activity"),
             params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
@@ -102,14 +94,14 @@ class TestSignupForActivity:
         
         # First signup should succeed
         response1 = client.post(
-            f"/activities/{activity_name}/signup",
+            SIGNUP_URL(activity_name),
             params={"email": email}
         )
         assert response1.status_code == 200
         
         # Second signup with same email should fail
         response2 = client.post(
-            f"/activities/{activity_name}/signup",
+            SIGNUP_URL(activity_name),
             params={"email": email}
         )
         assert response2.status_code == 400
@@ -121,15 +113,12 @@ class TestUnregisterFromActivity:
     
     def test_unregister_success(self, client, reset_activities):
         """Test successfully unregistering from an activity"""
-        # First sign up
-        client.post(
-            "/activities/Tennis Club/signup",
-            params={"email": "unregister@mergington.edu"}
-        )
+        # Seed an existing participant
+        _seed("Tennis Club", "unregister@mergington.edu")
         
         # Then unregister
         response = client.post(
-            "/activities/Tennis Club/unregister",
+            UNREGISTER_URL("Tennis Club"),
             params={"email": "unregister@mergington.edu"}
         )
         assert response.status_code == 200
@@ -137,31 +126,26 @@ class TestUnregisterFromActivity:
         assert "message" in data
         assert "unregister@mergington.edu" in data["message"]
     
-    def test_unregister_removes_participant(self, client, reset_activities):
+    def test_unregister_removes_participant(self, client, reset_activities, participants_of):
         """Test that unregister actually removes the participant"""
         email = "tempuser@mergington.edu"
         
-        # Sign up
-        client.post(
-            "/activities/Drama Club/signup",
-            params={"email": email}
-        )
+        # Seed an existing participant
+        _seed("Drama Club", email)
         
         # Unregister
         client.post(
-            "/activities/Drama Club/unregister",
+            UNREGISTER_URL("Drama Club"),
             params={"email": email}
         )
         
         # Verify participant was removed
-        response = client.get("/activities")
-        activities = response.json()
-        assert email not in activities["Drama Club"]["participants"]
+        assert email not in participants_of("Drama Club")
     
     def test_unregister_nonexistent_activity(self, client, reset_activities):
         """Test unregistering from an activity that doesn't exist"""
         response = client.post(
-            "/activities/Nonexistent Activity/unregister",
+            UNREGISTER_URL("Nonexistent Activity"),
             params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
@@ -170,24 +154,22 @@ class TestUnregisterFromActivity:
     def test_unregister_not_signed_up(self, client, reset_activities):
         """Test unregistering when not actually signed up"""
         response = client.post(
-            "/activities/Art Studio/unregister",
+            UNREGISTER_URL("Art Studio"),
             params={"email": "notregistered@mergington.edu"}
         )
         assert response.status_code == 400
         assert "not signed up" in response.json()["detail"]
     
-    def test_unregister_existing_participant(self, client, reset_activities):
+    def test_unregister_existing_participant(self, client, reset_activities, participants_of):
         """Test unregistering an existing participant"""
         response = client.post(
-            "/activities/Chess Club/unregister",
+            UNREGISTER_URL("Chess Club"),
             params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 200
         
         # Verify they were removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in participants_of("Chess Club")
 
 
 class TestRoot:
@@ -203,64 +185,58 @@ class TestRoot:
 class TestIntegration:
     """Integration tests for multiple operations"""
     
-    def test_multiple_signups_and_unregisters(self, client, reset_activities):
+    def test_multiple_signups_and_unregisters(self, client, reset_activities, participants_of):
         """Test multiple signup and unregister operations"""
         activity = "Gym Class"
         emails = ["user1@mergington.edu", "user2@mergington.edu", "user3@mergington.edu"]
         
         # Sign up multiple users
+        signup_url = SIGNUP_URL(activity)
         for email in emails:
             response = client.post(
-                f"/activities/{activity}/signup",
+                signup_url,
                 params={"email": email}
             )
             assert response.status_code == 200
         
         # Verify all are registered
-        response = client.get("/activities")
-        participants = response.json()[activity]["participants"]
+        participants = participants_of(activity)
         for email in emails:
             assert email in participants
         
         # Unregister one user
         client.post(
-            f"/activities/{activity}/unregister",
+            UNREGISTER_URL(activity),
             params={"email": emails[1]}
         )
         
         # Verify only that user was removed
-        response = client.get("/activities")
-        participants = response.json()[activity]["participants"]
+        participants = participants_of(activity)
         assert emails[0] in participants
         assert emails[1] not in participants
         assert emails[2] in participants
     
-    def test_signup_after_unregister(self, client, reset_activities):
+    def test_signup_after_unregister(self, client, reset_activities, participants_of):
         """Test that a user can sign up again after unregistering"""
         activity = "Basketball Team"
         email = "rejoiner@mergington.edu"
         
-        # Sign up
-        response1 = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        assert response1.status_code == 200
+        # Seed an existing participant
+        _seed(activity, email)
         
         # Unregister
-        response2 = client.post(
-            f"/activities/{activity}/unregister",
+        response = client.post(
+            UNREGISTER_URL(activity),
             params={"email": email}
         )
-        assert response2.status_code == 200
+        assert response.status_code == 200
         
         # Sign up again
-        response3 = client.post(
-            f"/activities/{activity}/signup",
+        rejoin_response = client.post(
+            SIGNUP_URL(activity),
             params={"email": email}
         )
-        assert response3.status_code == 200
+        assert rejoin_response.status_code == 200
         
         # Verify they're registered
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
+        assert email in participants_of(activity)